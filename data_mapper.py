@@ -21,10 +21,80 @@ Date: [Current Date]
 Version: 1.0
 """
 
+import os
 import re
-from typing import Dict, List, Any, Union, Tuple  # Import Tuple for type hints
+import ast
+import hashlib
+import itertools
+import logging
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Any, Union, Tuple  # Import Tuple for type hints
 from datetime import datetime
-import json
+from keyword_dictionary import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+# Regex patterns are compiled once at import time rather than on every call
+
+# Phrases introducing a decoration description, with the prefix used in output
+# (descriptions are capped at 49 characters, which also bounds each match attempt)
+_DECORATION_PATTERNS = [
+    (re.compile(r'decorated with ([\w\s,]{1,49}?)(?:\.|,|;|and)'), 'decorated'),
+    (re.compile(r'depicting ([\w\s,]{1,49}?)(?:\.|,|;|and)'), 'depicting'),
+    (re.compile(r'painted with ([\w\s,]{1,49}?)(?:\.|,|;|and)'), 'painted'),
+    (re.compile(r'design of ([\w\s,]{1,49}?)(?:\.|,|;|and)'), 'design'),
+    (re.compile(r'motif of ([\w\s,]{1,49}?)(?:\.|,|;|and)'), 'motif'),
+    (re.compile(r'pattern of ([\w\s,]{1,49}?)(?:\.|,|;|and)'), 'pattern')
+]
+
+# Delftware references in free text, as one alternation
+_DELFT_PATTERN = re.compile(
+    r'delft(?:ware|se?)?'
+    r'|dutch\s+(?:delft|pottery|ceramic)'
+    r'|hollants\s+porceleyn'
+    r'|de\s+porceleyne\s+fles'
+    r'|royal\s+delft'
+)
+
+# Belgian pottery references in free text, as one alternation
+_BELGIAN_PATTERN = re.compile(
+    r'belgian\s+(?:pottery|ceramic|porcelain)'
+    r'|brussels\s+(?:pottery|ceramic)'
+    r'|antwerp\s+(?:pottery|ceramic)'
+    r'|tournai\s+(?:pottery|ceramic)'
+)
+
+# 4-digit years between 1000 and 2029, or a century expression in one of
+# several languages, matched in a single scan of a period string
+_PERIOD_PATTERN = re.compile(
+    r'\b(?P<year>1[0-9]{3}|20[0-2][0-9])\b'
+    r'|\b(?P<century>\d{1,2})(?:'
+    r'(?:st|nd|rd|th)\s+century'    # English
+    r'|[èe]me\s+siècle'              # French
+    r'|\.\s+Jahrhundert'             # German
+    r'|[º°]\s+século'                # Portuguese
+    r'|\s+век'                       # Russian
+    r'|-luku'                        # Finnish
+    r'|\.\s+gadsimts'                # Latvian
+    r'|\s+amžius'                    # Lithuanian
+    r')\b',
+    re.IGNORECASE
+)
+
+# Any word character; every keyword and text pattern needs at least one
+_WORD_CHAR_PATTERN = re.compile(r'\w')
+
+# Inscription and mark descriptions, with the prefix used in output
+# (descriptions are capped at 29 characters, which also bounds each match attempt)
+_INSCRIPTION_PATTERNS = [
+    (re.compile(r'mark(?:ed)?\s+(?:of|with|reading)\s+([\w\s]{1,29}?)(?:\.|,|;)'), 'mark'),
+    (re.compile(r'inscription\s+(?:of|reading)\s+([\w\s]{1,29}?)(?:\.|,|;)'), 'inscription'),
+    (re.compile(r'(?:six|four|two)\s+character\s+mark\s+(?:of|reading)?\s*([\w\s]{1,29}?)(?:\.|,|;)'), 'character mark'),
+    (re.compile(r'reign\s+mark\s+of\s+([\w\s]{1,29}?)(?:\.|,|;)'), 'reign mark'),
+    (re.compile(r'signed\s+([\w\s]{1,29}?)(?:\.|,|;)'), 'signature')
+]
 
 class DataMapper:
     """
@@ -46,6 +116,42 @@ class DataMapper:
             - period_keywords: Historical period/dynasty mappings
     """
     
+    # Museum cities that show up in place fields but are not production places
+    _MUSEUM_LOCATIONS = frozenset({'vienna', 'stockholm', 'london', 'paris', 'new york'})
+    
+    # Sort rank of production places (lower first); unranked places follow alphabetically
+    _PRIORITY_RANK = {place: rank for rank, place in enumerate([
+        'jingdezhen', 'delft', 'longquan', 'dehua', 'yixing', 'jun', 'ding', 'cizhou',
+        'amsterdam', 'rotterdam', 'haarlem', 'makkum',
+        'antwerp', 'tournai', 'ghent',
+        'china', 'netherlands', 'belgium',
+        'meissen', 'sevres', 'worcester',
+        'export'
+    ])}
+    
+    # Keywords related to inscriptions and marks, in reporting order
+    _INSCRIPTION_KEYWORDS = (
+        'mark', 'marked', 'inscription', 'inscribed', 'character',
+        'seal', 'signature', 'signed', 'reign mark', 'nianzhi',
+        'nianzhao', 'tang', 'zhi', 'zao', 'six character',
+        'four character', 'seal mark', 'reign title', 'base mark'
+    )
+    
+    # Extraction quality flags and the descriptive metadata field each one checks
+    _QUALITY_FIELDS = (
+        ('has_color', 'ColoredDrawing'),
+        ('has_decoration', 'Decorations'),
+        ('has_shape', 'Shape'),
+        ('has_function', 'Function'),
+        ('has_material', 'Paste'),
+        ('has_glaze', 'Glaze'),
+        ('has_place', 'ProductionPlace'),
+        ('has_inscription', 'Inscriptions')
+    )
+    
+    # Number of distinct texts whose extractor results are cached
+    _TEXT_CACHE_SIZE = 8192
+    
     def __init__(self, keyword_dict):
         """
         Initialize the DataMapper with a keyword dictionary
@@ -54,10 +160,100 @@ class DataMapper:
             keyword_dict: Dictionary containing keyword mappings for various attributes
         """
         self.keyword_dict = keyword_dict
+        self.rebuild_matchers()
+    
+    def rebuild_matchers(self):
+        """
+        Compile the keyword matcher and one keyword index per keyword category
+        
+        The matcher scans a text once for the keywords of all categories and
+        the inscription keywords instead of running one regex search per
+        keyword, and its matches are shared by every extractor. Each index
+        maps a keyword back to the categories it belongs to, so extractors
+        only walk the keywords that matched instead of the whole category
+        dictionary. The text extractor cache is reset as well.
+        
+        Runs again automatically once the keyword dictionary's version
+        changes (after add_keyword, update_category, load_from_file or
+        rebuild_indexes), so it only needs calling directly to force a rebuild.
+        """
+        def compile_category(category_dict):
+            # Keyword -> (category rank, keyword rank, category, keyword) for each occurrence
+            index = {}
+            for category_rank, (category, keywords) in enumerate(category_dict.items()):
+                for keyword_rank, keyword in enumerate(keywords):
+                    index.setdefault(keyword, []).append((category_rank, keyword_rank, category, keyword))
+            return index
+        
+        self._color_index = compile_category(self.keyword_dict.color_keywords)
+        self._decoration_index = compile_category(self.keyword_dict.decoration_themes)
+        self._shape_index = compile_category(self.keyword_dict.shape_keywords)
+        self._function_index = compile_category(self.keyword_dict.function_keywords)
+        self._material_index = compile_category(self.keyword_dict.material_keywords)
+        self._glaze_index = compile_category(self.keyword_dict.glaze_keywords)
+        self._production_index = compile_category(self.keyword_dict.production_keywords)
+        
+        self._keyword_matcher = KeywordMatcher(itertools.chain(
+            self._color_index, self._decoration_index, self._shape_index, self._function_index,
+            self._material_index, self._glaze_index, self._production_index,
+            self._INSCRIPTION_KEYWORDS
+        ))
+        
+        # Decoration entries built once and shared by every item's output
+        self._decoration_labels = {
+            (theme, keyword): f"{theme}:{keyword}"
+            for theme, keywords in self.keyword_dict.decoration_themes.items() for keyword in keywords
+        }
+        self._color_labels = {color: f"color:{color}" for color in self.keyword_dict.color_keywords}
+        
+        # Substring alternation of each dynasty's period keywords, for short period strings
+        self._period_patterns = [
+            (dynasty, re.compile('|'.join(re.escape(keyword) for keyword in keywords)))
+            for dynasty, keywords in self.keyword_dict.period_keywords.items() if keywords
+        ]
+        
+        # Text extractor results by text digest, dropped whenever keywords change
+        self._text_cache = OrderedDict()
+        
+        self._keywords_version = self.keyword_dict.version
+    
+    def _check_keywords(self):
+        """
+        Rebuild the matchers if the keyword dictionary changed since they were built
+        """
+        if self._keywords_version != self.keyword_dict.version:
+            self.rebuild_matchers()
+    
+    def _find_keywords(self, text_lower: str) -> Dict[str, None]:
+        """
+        Scan lowercased text with the keyword matcher, rebuilding it first if
+        the keyword dictionary changed
+        """
+        self._check_keywords()
+        return self._keyword_matcher.find(text_lower)
+    
+    @staticmethod
+    def _keyword_hits(index: Dict[str, List[Tuple]], found: Dict[str, None]) -> List[Tuple[str, str]]:
+        """
+        Resolve matched keywords to (category, keyword) pairs
+        
+        Args:
+            index: Keyword index of a category dictionary, from rebuild_matchers
+            found: Keywords found in a text by the keyword matcher; keywords
+                   of other categories are ignored
+            
+        Returns:
+            One (category, keyword) pair per keyword occurrence in the category
+            dictionary, in dictionary order
+        """
+        return [entry[2:] for entry in sorted(entry for keyword in found for entry in index.get(keyword, ()))]
     
     def _flatten_list(self, lst: Union[List, Any]) -> List[str]:
         """
-        Recursively flatten nested lists into a single-level list of strings
+        Flatten nested lists into a single-level list of strings
+        
+        Uses an explicit stack instead of recursion, so deeply nested values
+        cost no extra call frames and cannot hit the recursion limit.
         
         Args:
             lst: Input list or value to flatten
@@ -66,15 +262,14 @@ class DataMapper:
             List of strings with all nested elements flattened
         """
         result = []
-        if isinstance(lst, list):
-            for item in lst:
-                if isinstance(item, list):
-                    # Recursively flatten nested lists
-                    result.extend(self._flatten_list(item))
-                elif item is not None:
-                    result.append(str(item))
-        elif lst is not None:
-            result.append(str(lst))
+        stack = [lst]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, list):
+                # Push children in reverse so they are popped in original order
+                stack.extend(reversed(item))
+            elif item is not None:
+                result.append(item if isinstance(item, str) else str(item))
         return result
     
     def extract_colored_drawing(self, text: str) -> List[str]:
@@ -98,22 +293,22 @@ class DataMapper:
         """
         if not text:
             return []
-            
         text_lower = text.lower()
+        return self._extract_colored_drawing(text_lower, self._find_keywords(text_lower))
+    
+    def _extract_colored_drawing(self, text_lower: str, found: Dict[str, None]) -> List[str]:
+        """
+        Extract color names from already lowercased text and its keyword matches
+        """
         colors_found = []
         
-        # Search for color keywords in the text
+        # Color categories with at least one keyword in the text (word-boundary matches)
         # The keyword_dict contains both Western and Eastern color terminology
-        for color_name, keywords in self.keyword_dict.color_keywords.items():
-            for keyword in keywords:
-                # Use word boundaries (\b) to ensure exact matches
-                # re.escape() handles special regex characters in keywords
-                if re.search(r'\b' + re.escape(keyword) + r'\b', text_lower):
-                    colors_found.append(color_name)
-                    break  # One match per color category is sufficient
+        for color_name, _ in self._keyword_hits(self._color_index, found):
+            colors_found.append(color_name)
         
-        # Return unique color names to avoid duplicates
-        return list(set(colors_found))
+        # Return unique color names in dictionary order
+        return list(dict.fromkeys(colors_found))
     
     def extract_decorations(self, text: str) -> List[str]:
         """
@@ -127,53 +322,52 @@ class DataMapper:
         """
         if not text:
             return []
-            
         text_lower = text.lower()
-        decorations = []
+        return self._extract_decorations(text_lower, self._find_keywords(text_lower))
+    
+    def _extract_decorations(self, text_lower: str, found: Dict[str, None]) -> List[str]:
+        """
+        Extract decoration descriptions from already lowercased text and its keyword matches
+        """
+        # Remove duplicates while preserving order
+        # (entries are built from lowercased text and keys, so exact dedup suffices)
+        # and stop producing entries once 15 unique decorations are collected
+        unique_decorations = {}
+        for decoration in self._iter_decorations(text_lower, found):
+            unique_decorations[decoration] = None
+            if len(unique_decorations) == 15:
+                break
+        
+        return list(unique_decorations)
+    
+    def _iter_decorations(self, text_lower: str, found: Dict[str, None]) -> Iterator[str]:
+        """
+        Generate decoration entries lazily, in output order and possibly repeated
         
-        # Extract decoration themes from keyword dictionary
-        for theme, keywords in self.keyword_dict.decoration_themes.items():
-            theme_decorations = []
-            for keyword in keywords:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', text_lower):
-                    theme_decorations.append(keyword)
+        Args:
+            text_lower: Lowercased text to analyze
+            found: Keywords found in the text by the keyword matcher
             
+        Yields:
+            Theme keywords, then colors, then phrase pattern matches
+        """
+        # Extract decoration themes from keyword dictionary
+        theme_counts = {}
+        for theme, keyword in self._keyword_hits(self._decoration_index, found):
             # Limit to 3 keywords per theme to avoid redundancy
-            for keyword in theme_decorations[:3]:
-                decorations.append(f"{theme}:{keyword}")
+            if theme_counts.get(theme, 0) < 3:
+                theme_counts[theme] = theme_counts.get(theme, 0) + 1
+                yield self._decoration_labels[theme, keyword]
         
         # Include colors as part of decoration metadata
-        colors = self.extract_colored_drawing(text)
-        decorations.extend([f"color:{c}" for c in colors])
+        for color in self._extract_colored_drawing(text_lower, found):
+            yield self._color_labels[color]
         
         # Use regex patterns to extract specific decoration descriptions
-        decoration_patterns = [
-            (r'decorated with ([\w\s,]+?)(?:\.|,|;|and)', 'decorated'),
-            (r'depicting ([\w\s,]+?)(?:\.|,|;|and)', 'depicting'),
-            (r'painted with ([\w\s,]+?)(?:\.|,|;|and)', 'painted'),
-            (r'design of ([\w\s,]+?)(?:\.|,|;|and)', 'design'),
-            (r'motif of ([\w\s,]+?)(?:\.|,|;|and)', 'motif'),
-            (r'pattern of ([\w\s,]+?)(?:\.|,|;|and)', 'pattern')
-        ]
-        
-        # Extract decoration patterns from text
-        for pattern, prefix in decoration_patterns:
-            matches = re.findall(pattern, text_lower)
+        for pattern, prefix in _DECORATION_PATTERNS:
+            matches = pattern.findall(text_lower)
             for match in matches[:2]:  # Limit to 2 matches per pattern
-                if len(match) < 50:  # Filter out overly long descriptions
-                    decorations.append(f"{prefix}:{match.strip()}")
-        
-        # Remove duplicates while preserving order
-        unique_decorations = []
-        seen = set()
-        for dec in decorations:
-            dec_lower = dec.lower()
-            if dec_lower not in seen:
-                unique_decorations.append(dec)
-                seen.add(dec_lower)
-        
-        # Return up to 15 unique decorations
-        return unique_decorations[:15]
+                yield f"{prefix}:{match.strip()}"
     
     def extract_shape(self, text: str) -> List[str]:
         """
@@ -187,23 +381,26 @@ class DataMapper:
         """
         if not text:
             return []
-            
         text_lower = text.lower()
+        return self._extract_shape(text_lower, self._find_keywords(text_lower))
+    
+    def _extract_shape(self, text_lower: str, found: Dict[str, None]) -> List[str]:
+        """
+        Extract shape descriptions from already lowercased text and its keyword matches
+        """
         shapes_found = []
         shape_details = []
         
         # Match shape keywords from dictionary
-        for shape_type, keywords in self.keyword_dict.shape_keywords.items():
-            for keyword in keywords:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', text_lower):
-                    shapes_found.append(shape_type)
-                    # Capture specific shape details if different from main type
-                    if keyword != shape_type:
-                        shape_details.append(keyword)
+        for shape_type, keyword in self._keyword_hits(self._shape_index, found):
+            shapes_found.append(shape_type)
+            # Capture specific shape details if different from main type
+            if keyword != shape_type:
+                shape_details.append(keyword)
         
         # Combine and deduplicate results
-        result = list(set(shapes_found))
-        result.extend([d for d in set(shape_details) if d not in result])
+        result = list(dict.fromkeys(shapes_found))
+        result.extend([d for d in dict.fromkeys(shape_details) if d not in result])
         
         # Return up to 5 shape descriptors
         return result[:5]
@@ -220,18 +417,20 @@ class DataMapper:
         """
         if not text:
             return []
-            
         text_lower = text.lower()
+        return self._extract_function(text_lower, self._find_keywords(text_lower))
+    
+    def _extract_function(self, text_lower: str, found: Dict[str, None]) -> List[str]:
+        """
+        Extract function types from already lowercased text and its keyword matches
+        """
         functions_found = []
         
         # Match function keywords from dictionary
-        for function_type, keywords in self.keyword_dict.function_keywords.items():
-            for keyword in keywords:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', text_lower):
-                    functions_found.append(function_type)
-                    break  # Only need one match per function type
+        for function_type, _ in self._keyword_hits(self._function_index, found):
+            functions_found.append(function_type)
         
-        return list(set(functions_found))
+        return list(dict.fromkeys(functions_found))
     
     def extract_material(self, text: str) -> List[str]:
         """
@@ -245,15 +444,18 @@ class DataMapper:
         """
         if not text:
             return []
-            
         text_lower = text.lower()
+        return self._extract_material(text_lower, self._find_keywords(text_lower))
+    
+    def _extract_material(self, text_lower: str, found: Dict[str, None]) -> List[str]:
+        """
+        Extract material types from already lowercased text and its keyword matches
+        """
         materials_found = []
         
         # Match material keywords from dictionary
-        for material_type, keywords in self.keyword_dict.material_keywords.items():
-            for keyword in keywords:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', text_lower):
-                    materials_found.append(material_type)
+        for material_type, _ in self._keyword_hits(self._material_index, found):
+            materials_found.append(material_type)
         
         # Apply default material inference if no explicit materials found
         if not materials_found:
@@ -262,7 +464,7 @@ class DataMapper:
             elif any(word in text_lower for word in ['porcelain', 'china']):
                 materials_found.append('porcelain')
         
-        return list(set(materials_found))
+        return list(dict.fromkeys(materials_found))
     
     def extract_glaze(self, text: str) -> List[str]:
         """
@@ -276,23 +478,26 @@ class DataMapper:
         """
         if not text:
             return []
-            
         text_lower = text.lower()
+        return self._extract_glaze(text_lower, self._find_keywords(text_lower))
+    
+    def _extract_glaze(self, text_lower: str, found: Dict[str, None]) -> List[str]:
+        """
+        Extract glaze types from already lowercased text and its keyword matches
+        """
         glazes_found = []
         
         # Match glaze keywords from dictionary
-        for glaze_type, keywords in self.keyword_dict.glaze_keywords.items():
-            for keyword in keywords:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', text_lower):
-                    # Normalize underscores to spaces in glaze type names
-                    normalized_type = glaze_type.replace('_', ' ')
-                    glazes_found.append(normalized_type)
-                    # Include specific keyword if different from normalized type
-                    if keyword != glaze_type and keyword != normalized_type:
-                        glazes_found.append(keyword)
+        for glaze_type, keyword in self._keyword_hits(self._glaze_index, found):
+            # Normalize underscores to spaces in glaze type names
+            normalized_type = glaze_type.replace('_', ' ')
+            glazes_found.append(normalized_type)
+            # Include specific keyword if different from normalized type
+            if keyword != glaze_type and keyword != normalized_type:
+                glazes_found.append(keyword)
         
         # Return up to 5 unique glaze types
-        return list(set(glazes_found))[:5]
+        return list(dict.fromkeys(glazes_found))[:5]
     
     def extract_production_place(self, item: Dict[str, Any], text: str) -> List[str]:
         """
@@ -324,6 +529,58 @@ class DataMapper:
             ... )
             ['delft', 'netherlands']
         """
+        text_lower = text.lower() if text else ''
+        return self._extract_production_place(item, text_lower, self._find_keywords(text_lower))
+    
+    def _extract_production_place(self, item: Dict[str, Any], text_lower: str,
+                                  found: Dict[str, None]) -> List[str]:
+        """
+        Extract production places from item metadata, already lowercased text
+        and its keyword matches
+        """
+        return self._merge_production_places(item, self._extract_text_places(text_lower, found))
+    
+    def _extract_text_places(self, text_lower: str, found: Dict[str, None]) -> List[str]:
+        """
+        Extract production places mentioned in already lowercased text
+        
+        Args:
+            text_lower: Lowercased description text
+            found: Keywords found in the text by the keyword matcher
+            
+        Returns:
+            Unnormalized list of places, before museum filtering and sorting
+        """
+        text_places = []
+        if not text_lower:
+            return text_places
+        
+        # Check production place keywords
+        for place_type, _ in self._keyword_hits(self._production_index, found):
+            text_places.append(place_type)
+        
+        # Special pattern recognition for Delftware
+        # (avoid double counting by not automatically adding netherlands)
+        if _DELFT_PATTERN.search(text_lower):
+            text_places.append('delft')
+        
+        # Belgian pottery patterns
+        if _BELGIAN_PATTERN.search(text_lower):
+            text_places.append('belgium')
+        
+        return text_places
+    
+    def _merge_production_places(self, item: Dict[str, Any], text_places: List[str]) -> List[str]:
+        """
+        Combine the places of an item's metadata fields with places found in its text
+        
+        Args:
+            item: Dictionary containing item metadata with potential place fields
+            text_places: Places found in the item's text, from _extract_text_places
+            
+        Returns:
+            List of production places, prioritized and limited to 10 items
+        """
         places = []
         normalized_places = set()
         
@@ -341,10 +598,10 @@ class DataMapper:
                             # This format is common in Europeana data
                             if p.startswith('{') and 'def' in p:
                                 try:
-                                    p_dict = json.loads(p.replace("'", '"'))
-                                    if 'def' in p_dict:
+                                    p_dict = ast.literal_eval(p)
+                                    if isinstance(p_dict, dict) and 'def' in p_dict:
                                         p = p_dict['def']
-                                except:
+                                except (ValueError, SyntaxError, TypeError):
                                     pass  # If parsing fails, use original string
                             
                             # Normalize place names using keyword dictionary
@@ -366,49 +623,12 @@ class DataMapper:
                     if normalized and len(normalized) < 50:
                         normalized_places.add(normalized)
         
-        # 2. Extract production place from text content
-        if text:
-            text_lower = text.lower()
-            
-            # Check production place keywords
-            for place_type, keywords in self.keyword_dict.production_keywords.items():
-                for keyword in keywords:
-                    if re.search(r'\b' + re.escape(keyword) + r'\b', text_lower):
-                        normalized_places.add(place_type)
-                        break
-            
-            # Special pattern recognition for Delftware
-            delft_patterns = [
-                r'delft(?:ware|se?)?',
-                r'dutch\s+(?:delft|pottery|ceramic)',
-                r'hollants\s+porceleyn',
-                r'de\s+porceleyne\s+fles',
-                r'royal\s+delft'
-            ]
-            
-            for pattern in delft_patterns:
-                if re.search(pattern, text_lower):
-                    normalized_places.add('delft')
-                    # Avoid double counting by not automatically adding netherlands
-                    break
-            
-            # Belgian pottery patterns
-            belgian_patterns = [
-                r'belgian\s+(?:pottery|ceramic|porcelain)',
-                r'brussels\s+(?:pottery|ceramic)',
-                r'antwerp\s+(?:pottery|ceramic)',
-                r'tournai\s+(?:pottery|ceramic)'
-            ]
-            
-            for pattern in belgian_patterns:
-                if re.search(pattern, text_lower):
-                    normalized_places.add('belgium')
-                    break
+        # 2. Add production places found in text content
+        normalized_places.update(text_places)
         
         # 3. Clean up results
         # Remove potential museum locations (not production places)
-        museum_locations = ['vienna', 'stockholm', 'london', 'paris', 'new york']
-        normalized_places = {p for p in normalized_places if p not in museum_locations}
+        normalized_places -= self._MUSEUM_LOCATIONS
         
         # Merge Brussels variants to Belgium
         if 'brussels' in normalized_places:
@@ -416,26 +636,10 @@ class DataMapper:
             normalized_places.remove('brussels')
         
         # 4. Priority-based sorting
-        final_places = []
-        
-        # Define priority order for production places
-        priority_order = [
-            'jingdezhen', 'delft', 'longquan', 'dehua', 'yixing', 'jun', 'ding', 'cizhou',
-            'amsterdam', 'rotterdam', 'haarlem', 'makkum',
-            'antwerp', 'tournai', 'ghent',
-            'china', 'netherlands', 'belgium',
-            'meissen', 'sevres', 'worcester',
-            'export'
-        ]
-        
-        # Add high-priority places first
-        for place in priority_order:
-            if place in normalized_places:
-                final_places.append(place)
-                normalized_places.remove(place)
-        
-        # Add remaining places in alphabetical order
-        final_places.extend(sorted(normalized_places))
+        # High-priority places first in priority order, remaining places alphabetically
+        unranked = len(self._PRIORITY_RANK)
+        final_places = sorted(normalized_places,
+                              key=lambda place: (self._PRIORITY_RANK.get(place, unranked), place))
         
         # Return up to 10 production places
         return final_places[:10]
@@ -455,7 +659,6 @@ class DataMapper:
         """
         periods = []
         years = []
-        dynasty_info = {}
         
         # 1. Extract from Period field
         period_data = item.get('Metadata_for_Management', {}).get('Period', '')
@@ -483,74 +686,52 @@ class DataMapper:
                 period_strings.append(p_str)
         
         # 2. Parse period strings for years and dynasties
+        self._check_keywords()
         for period_str in period_strings:
-            # Extract 4-digit years
-            year_matches = re.findall(r'\b(1[0-9]{3}|20[0-2][0-9])\b', period_str)
-            for year_str in year_matches:
-                year = int(year_str)
-                if 1000 <= year <= 2025:
-                    years.append(year)
-            
-            # Extract centuries and convert to years (using mid-century as representative)
-            century_patterns = [
-                (r'\b(\d{1,2})(?:st|nd|rd|th)\s+century\b', 'en'),  # English
-                (r'\b(\d{1,2})[èe]me\s+siècle\b', 'fr'),           # French
-                (r'\b(\d{1,2})\.\s+Jahrhundert\b', 'de'),          # German
-                (r'\b(\d{1,2})[º°]\s+século\b', 'pt'),             # Portuguese
-                (r'\b(\d{1,2})\s+век\b', 'ru'),                    # Russian
-                (r'\b(\d{1,2})-luku\b', 'fi'),                     # Finnish
-                (r'\b(\d{1,2})\.\s+gadsimts\b', 'lv'),            # Latvian
-                (r'\b(\d{1,2})\s+amžius\b', 'lt'),                # Lithuanian
-            ]
-            
-            for pattern, lang in century_patterns:
-                matches = re.findall(pattern, period_str, re.IGNORECASE)
-                for match in matches:
-                    century = int(match)
-                    if 1 <= century <= 21:
-                        # Use mid-century year as representative
-                        year = (century - 1) * 100 + 50
+            # Extract 4-digit years and centuries in one scan
+            century_years = []
+            for match in _PERIOD_PATTERN.finditer(period_str):
+                if match.group('year'):
+                    year = int(match.group('year'))
+                    if 1000 <= year <= 2025:
                         years.append(year)
+                else:
+                    century = int(match.group('century'))
+                    if 1 <= century <= 21:
+                        # Convert centuries to years, using mid-century as representative
+                        century_years.append((century - 1) * 100 + 50)
                         periods.append(f"{century}th century")
             
+            # Century-derived years follow the explicit years of the string
+            years.extend(century_years)
+            
             # Extract dynasty information
             period_lower = period_str.lower()
-            for dynasty, keywords in self.keyword_dict.period_keywords.items():
-                for keyword in keywords:
-                    if keyword in period_lower:
-                        periods.append(dynasty.capitalize())
-                        break
+            for dynasty, pattern in self._period_patterns:
+                if pattern.search(period_lower):
+                    periods.append(dynasty.capitalize())
         
         # 3. Infer dynasty from years
-        for year in years:
-            dynasty = self.keyword_dict.get_dynasty_from_year(year)
-            if dynasty != 'Unknown':
-                dynasty_info[year] = dynasty
-                if dynasty not in periods:
-                    periods.append(dynasty)
+        dynasty_info = self.keyword_dict.dynasties_for_years(years)
+        for dynasty in dynasty_info.values():
+            if dynasty not in periods:
+                periods.append(dynasty)
         
         # 4. Clean and deduplicate results
         # Remove duplicate and invalid years
-        unique_years = []
-        for year in years:
-            if 1000 <= year <= 2025 and year not in unique_years:
-                unique_years.append(year)
+        unique_years = list(dict.fromkeys(year for year in years if 1000 <= year <= 2025))
+        sorted_years = sorted(unique_years)
         
         # Remove duplicate periods
-        unique_periods = []
-        seen = set()
-        for period in periods:
-            if period and period not in seen and len(period) < 50:
-                unique_periods.append(period)
-                seen.add(period.lower())
+        unique_periods = list(dict.fromkeys(period for period in periods if period and len(period) < 50))
         
         # 5. Generate comprehensive period summary
         period_summary = {
             'periods': unique_periods[:5],
-            'years': sorted(unique_years)[:10],
+            'years': sorted_years[:10],
             'dynasty_mapping': dynasty_info,
             'century': self.keyword_dict.get_century_from_year(unique_years[0]) if unique_years else None,
-            'date_range': f"{min(unique_years)}-{max(unique_years)}" if len(unique_years) > 1 else str(unique_years[0]) if unique_years else None
+            'date_range': f"{sorted_years[0]}-{sorted_years[-1]}" if len(sorted_years) > 1 else str(sorted_years[0]) if sorted_years else None
         }
         
         return unique_periods, unique_years, period_summary
@@ -567,52 +748,90 @@ class DataMapper:
         """
         if not text:
             return []
-            
         text_lower = text.lower()
+        return self._extract_inscriptions(text_lower, self._find_keywords(text_lower))
+    
+    def _extract_inscriptions(self, text_lower: str, found: Dict[str, None]) -> List[str]:
+        """
+        Extract inscription descriptions from already lowercased text and its keyword matches
+        """
         inscriptions = []
         
-        # Keywords related to inscriptions and marks
-        inscription_keywords = [
-            'mark', 'marked', 'inscription', 'inscribed', 'character',
-            'seal', 'signature', 'signed', 'reign mark', 'nianzhi',
-            'nianzhao', 'tang', 'zhi', 'zao', 'six character', 
-            'four character', 'seal mark', 'reign title', 'base mark'
-        ]
-        
-        # Find relevant keywords in text
-        found_keywords = []
-        for keyword in inscription_keywords:
-            if keyword in text_lower:
-                found_keywords.append(keyword)
+        # Find relevant keywords in text (whole words only, so 'tang' does not match 'orangutang')
+        found_keywords = [keyword for keyword in self._INSCRIPTION_KEYWORDS if keyword in found]
         
         # Add up to 3 found keywords
         inscriptions.extend(found_keywords[:3])
         
         # Extract specific inscription content using patterns
-        inscription_patterns = [
-            (r'mark(?:ed)?\s+(?:of|with|reading)\s+([\w\s]+?)(?:\.|,|;)', 'mark'),
-            (r'inscription\s+(?:of|reading)\s+([\w\s]+?)(?:\.|,|;)', 'inscription'),
-            (r'(?:six|four|two)\s+character\s+mark\s+(?:of|reading)?\s*([\w\s]+?)(?:\.|,|;)', 'character mark'),
-            (r'reign\s+mark\s+of\s+([\w\s]+?)(?:\.|,|;)', 'reign mark'),
-            (r'signed\s+([\w\s]+?)(?:\.|,|;)', 'signature')
-        ]
-        
-        # Extract inscription patterns from text
-        for pattern, prefix in inscription_patterns:
-            matches = re.findall(pattern, text_lower)
+        for pattern, prefix in _INSCRIPTION_PATTERNS:
+            matches = pattern.findall(text_lower)
             for match in matches[:2]:  # Limit to 2 matches per pattern
-                if len(match) < 30:  # Filter out overly long descriptions
-                    inscriptions.append(f"{prefix}:{match.strip()}")
+                inscriptions.append(f"{prefix}:{match.strip()}")
         
         # Check for dynasty-related marks
-        for period, keywords in self.keyword_dict.period_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower and 'mark' in text_lower:
+        if 'mark' in text_lower:
+            for period, keywords in self.keyword_dict.period_keywords.items():
+                if any(keyword in text_lower for keyword in keywords):
                     inscriptions.append(f"period mark:{period}")
-                    break
         
-        # Return up to 5 unique inscriptions
-        return list(set(inscriptions))[:5]
+        # Return up to 5 unique inscriptions, in order found
+        return list(dict.fromkeys(inscriptions))[:5]
+    
+    def _extract_all(self, text_lower: str) -> Dict[str, List[str]]:
+        """
+        Run every text extractor on already lowercased text
+        
+        The text is scanned once for the keywords of every category and the
+        matches are shared by all extractors. Results are kept in a bounded
+        LRU cache keyed by a digest of the text, since the same descriptions
+        recur across records and batches; callers get fresh list copies. The
+        keyword version is checked first, so results cached before a keyword
+        change are dropped with the rebuilt matchers instead of being served.
+        
+        Args:
+            text_lower: Lowercased text to analyze
+            
+        Returns:
+            Dictionary with the ColoredDrawing, Decorations, Shape, Function,
+            Paste, Glaze and Inscriptions results, and the places found in the
+            text under ProductionPlace (before merging with the item's fields)
+        """
+        self._check_keywords()
+        # surrogatepass: JSON-loaded text can hold lone surrogates (e.g. half an emoji pair)
+        key = hashlib.blake2b(text_lower.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        extracted = self._text_cache.get(key)
+        if extracted is None:
+            extracted = self._run_extractors(text_lower)
+            self._text_cache[key] = extracted
+            if len(self._text_cache) > self._TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        
+        return {field: list(values) for field, values in extracted.items()}
+    
+    def _run_extractors(self, text_lower: str) -> Dict[str, List[str]]:
+        """
+        Run every text extractor on already lowercased text, without caching
+        """
+        # Empty or punctuation-only text cannot match any keyword or pattern,
+        # so the text extractors are skipped
+        if not _WORD_CHAR_PATTERN.search(text_lower):
+            return {field: [] for field in ('ColoredDrawing', 'Decorations', 'Shape', 'Function',
+                                            'Paste', 'Glaze', 'ProductionPlace', 'Inscriptions')}
+        
+        found = self._keyword_matcher.find(text_lower)
+        return {
+            'ColoredDrawing': self._extract_colored_drawing(text_lower, found),
+            'Decorations': self._extract_decorations(text_lower, found),
+            'Shape': self._extract_shape(text_lower, found),
+            'Function': self._extract_function(text_lower, found),
+            'Paste': self._extract_material(text_lower, found),
+            'Glaze': self._extract_glaze(text_lower, found),
+            'ProductionPlace': self._extract_text_places(text_lower, found),
+            'Inscriptions': self._extract_inscriptions(text_lower, found)
+        }
     
     def map_to_descriptive_metadata(self, item: Dict[str, Any], text: str, 
                                   lda_topics: List[Dict] = None) -> Dict[str, Any]:
@@ -633,45 +852,142 @@ class DataMapper:
             desc_data = item['dcDescription']
             descriptions = self._flatten_list(desc_data)
         
+        # Lowercase the text once and share it between all extractors
+        text_lower = text.lower() if text else ''
+        
+        return self._map_to_descriptive_metadata(item, descriptions, text_lower, lda_topics)
+    
+    def map_batch(self, items: List[Dict[str, Any]], texts: List[str],
+                  lda_topics_list: List[List[Dict]] = None) -> List[Dict[str, Any]]:
+        """
+        Map a batch of items to descriptive metadata column by column
+        
+        The batch is first transposed into columns (flattened descriptions,
+        lowercased texts), each prepared in one pass, and the per-item
+        metadata dictionaries are built from the columns afterwards.
+        
+        Args:
+            items: List of item metadata dictionaries
+            texts: Combined text for each item, in the same order as items
+            lda_topics_list: Optional LDA topic results for each item
+            
+        Returns:
+            List of descriptive metadata dictionaries in input order, as
+            returned by map_to_descriptive_metadata
+        """
+        if lda_topics_list is None:
+            lda_topics_list = [None] * len(items)
+        
+        # Transpose the batch into columns
+        description_column = [self._flatten_list(item.get('dcDescription')) for item in items]
+        text_lower_column = [text.lower() if text else '' for text in texts]
+        
+        return [self._map_to_descriptive_metadata(item, descriptions, text_lower, lda_topics)
+                for item, descriptions, text_lower, lda_topics
+                in zip(items, description_column, text_lower_column, lda_topics_list)]
+    
+    def map_batch_columnar(self, items: List[Dict[str, Any]], texts: List[str],
+                           lda_topics_list: List[List[Dict]] = None) -> Dict[str, List[Any]]:
+        """
+        Map a batch of items to descriptive metadata stored column by column
+        
+        Each item's fields, built by the same helper as the per-item mapping,
+        are appended to their columns as the items are processed instead of
+        being transposed from per-item metadata dictionaries.
+        
+        Args:
+            items: List of item metadata dictionaries
+            texts: Combined text for each item, in the same order as items
+            lda_topics_list: Optional LDA topic results for each item
+            
+        Returns:
+            Dictionary mapping each descriptive metadata field to a list with
+            one value per item, in input order; the lda_topics column is only
+            present if some item has topics, with None for the others
+        """
+        if lda_topics_list is None:
+            lda_topics_list = [None] * len(items)
+        
+        columns = {}
+        lda_column = []
+        
+        for item, text, lda_topics in zip(items, texts, lda_topics_list):
+            fields = self._descriptive_fields(item, self._flatten_list(item.get('dcDescription')),
+                                              text.lower() if text else '')
+            extraction_quality, quality_score = self._extraction_quality(dict(fields))
+            
+            for field, value in (*fields, ('extraction_quality', extraction_quality),
+                                 ('quality_score', quality_score)):
+                columns.setdefault(field, []).append(value)
+            lda_column.append(lda_topics if lda_topics else None)
+        
+        if any(lda_column):
+            columns['lda_topics'] = lda_column
+        
+        return columns
+    
+    def _map_to_descriptive_metadata(self, item: Dict[str, Any], descriptions: List[str],
+                                     text_lower: str, lda_topics: List[Dict] = None) -> Dict[str, Any]:
+        """
+        Build descriptive metadata from flattened descriptions and lowercased text
+        """
         # Build descriptive metadata structure
-        descriptive_metadata = {
-            'Descriptions': descriptions[:3],  # Limit to 3 descriptions
-            'ColoredDrawing': self.extract_colored_drawing(text),
-            'Decorations': self.extract_decorations(text),
-            'Shape': self.extract_shape(text),
-            'ShapeDescription': [],  # Additional shape details can be added here
-            'Function': self.extract_function(text),
-            'FunctionCategory': [],  # Higher-level function categories can be added
-            'Paste': self.extract_material(text),
-            'PasteMaterial': self.extract_material(text),  # Same as Paste for now
-            'Glaze': self.extract_glaze(text),
-            'ProductionPlace': self.extract_production_place(item, text),
-            'ProductionPlaceLocation': self.extract_production_place(item, text),  # Same as ProductionPlace
-            'Inscriptions': self.extract_inscriptions(text)
-        }
+        descriptive_metadata = dict(self._descriptive_fields(item, descriptions, text_lower))
         
         # Add LDA topic information if available
         if lda_topics:
             descriptive_metadata['lda_topics'] = lda_topics
         
-        # Calculate extraction quality metrics
-        extraction_quality = {
-            'has_color': len(descriptive_metadata['ColoredDrawing']) > 0,
-            'has_decoration': len(descriptive_metadata['Decorations']) > 0,
-            'has_shape': len(descriptive_metadata['Shape']) > 0,
-            'has_function': len(descriptive_metadata['Function']) > 0,
-            'has_material': len(descriptive_metadata['Paste']) > 0,
-            'has_glaze': len(descriptive_metadata['Glaze']) > 0,
-            'has_place': len(descriptive_metadata['ProductionPlace']) > 0,
-            'has_inscription': len(descriptive_metadata['Inscriptions']) > 0
-        }
-        
         # Add quality metrics to metadata
+        extraction_quality, quality_score = self._extraction_quality(descriptive_metadata)
         descriptive_metadata['extraction_quality'] = extraction_quality
-        descriptive_metadata['quality_score'] = sum(extraction_quality.values()) / len(extraction_quality)
+        descriptive_metadata['quality_score'] = quality_score
         
         return descriptive_metadata
     
+    def _descriptive_fields(self, item: Dict[str, Any], descriptions: List[str],
+                            text_lower: str) -> List[Tuple[str, Any]]:
+        """
+        Build the extracted descriptive metadata fields of one item
+        
+        Shared by the per-item and columnar mappings, which add the LDA topics
+        and quality metrics themselves.
+        
+        Returns:
+            (field, value) pairs in output order
+        """
+        extracted = self._extract_all(text_lower)
+        
+        # Materials and places each feed two fields
+        materials = extracted['Paste']
+        places = self._merge_production_places(item, extracted['ProductionPlace'])
+        
+        return [
+            ('Descriptions', descriptions[:3]),  # Limit to 3 descriptions
+            ('ColoredDrawing', extracted['ColoredDrawing']),
+            ('Decorations', extracted['Decorations']),
+            ('Shape', extracted['Shape']),
+            ('ShapeDescription', []),  # Additional shape details can be added here
+            ('Function', extracted['Function']),
+            ('FunctionCategory', []),  # Higher-level function categories can be added
+            ('Paste', materials),
+            ('PasteMaterial', list(materials)),  # Same as Paste for now
+            ('Glaze', extracted['Glaze']),
+            ('ProductionPlace', places),
+            ('ProductionPlaceLocation', list(places)),  # Same as ProductionPlace
+            ('Inscriptions', extracted['Inscriptions'])
+        ]
+    
+    def _extraction_quality(self, fields: Dict[str, Any]) -> Tuple[Dict[str, bool], float]:
+        """
+        Calculate extraction quality metrics from descriptive metadata fields
+        
+        Returns:
+            Tuple of (flag per quality field, share of quality fields filled)
+        """
+        extraction_quality = {flag: bool(fields[field]) for flag, field in self._QUALITY_FIELDS}
+        return extraction_quality, sum(extraction_quality.values()) / len(self._QUALITY_FIELDS)
+    
     def map_to_management_metadata(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """
         Map item data to management metadata structure
@@ -732,12 +1048,7 @@ class DataMapper:
             all_titles.extend(titles)
         
         # Deduplicate titles
-        unique_titles = []
-        seen = set()
-        for title in all_titles:
-            if isinstance(title, str) and title and title not in seen:
-                unique_titles.append(title)
-                seen.add(title)
+        unique_titles = list(dict.fromkeys(title for title in all_titles if isinstance(title, str) and title))
         
         management_metadata['Used_Titles'] = unique_titles
         
@@ -785,7 +1096,8 @@ class DataMapper:
         return extended_metadata
     
     def process_item(self, item: Dict[str, Any], text: str, 
-                    lda_topics: List[Dict] = None) -> Dict[str, Any]:
+                    lda_topics: List[Dict] = None,
+                    processed_date: str = None) -> Dict[str, Any]:
         """
         Process a single data item to generate complete mapped structure
         
@@ -804,6 +1116,8 @@ class DataMapper:
             text: Combined text content for analysis (descriptions, titles, etc.)
             lda_topics: Optional LDA (Latent Dirichlet Allocation) topic analysis 
                        results for thematic classification
+            processed_date: Optional ISO 8601 processing timestamp; batch callers
+                           pass one shared value instead of reading the clock per item
             
         Returns:
             Dictionary with complete mapped metadata structure, or error structure
@@ -819,9 +1133,14 @@ class DataMapper:
             ['blue', 'white']
             
         Error Handling:
-            If processing fails, returns a minimal structure with error information
-            in the ProcessingMetadata field rather than raising an exception.
+            If the item data is malformed (AttributeError, IndexError, KeyError,
+            TypeError or ValueError while mapping), returns a minimal structure
+            with error information in the ProcessingMetadata field rather than
+            raising an exception.
         """
+        if processed_date is None:
+            processed_date = datetime.now().isoformat()  # ISO 8601 format
+        
         try:
             # Build complete result structure by calling specialized mapping methods
             result = {
@@ -838,7 +1157,7 @@ class DataMapper:
                 
                 # Add processing metadata for quality control and auditing
                 'ProcessingMetadata': {
-                    'processed_date': datetime.now().isoformat(),  # ISO 8601 format
+                    'processed_date': processed_date,
                     'preprocessing_metadata': item.get('preprocessing_metadata', {}),
                     'processing_version': '1.0',  # Track schema/processing version
                     'source_system': item.get('source', 'unknown')  # Track data source
@@ -850,18 +1169,19 @@ class DataMapper:
             
             return result
             
-        except Exception as e:
-            # Handle processing errors gracefully without breaking the pipeline
-            # This ensures batch processing can continue even if individual items fail
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError) as e:
+            # Handle malformed item data gracefully without breaking the pipeline
+            # This ensures batch processing can continue even if individual items fail;
+            # anything else is a bug and propagates
             
-            import traceback
             error_details = {
                 'error_message': str(e),
                 'error_type': type(e).__name__,
                 'traceback': traceback.format_exc()  # Full stack trace for debugging
             }
             
-            print(f"Error processing item {item.get('id', 'unknown')}: {e}")
+            # Log with the traceback, which also reaches stderr from worker processes
+            logger.exception("Error processing item %s: %s", item.get('id', 'unknown'), e)
             
             # Return minimal valid structure with error information
             return {
@@ -870,8 +1190,131 @@ class DataMapper:
                 'Metadata_for_Management': {},
                 'ExtendedMetadata': {},
                 'ProcessingMetadata': {
-                    'processed_date': datetime.now().isoformat(),
+                    'processed_date': processed_date,
                     'status': 'error',
                     'error': error_details
                 }
             }
+    
+    def process_items(self, items: List[Dict[str, Any]], texts: List[str],
+                     lda_topics_list: List[List[Dict]] = None,
+                     workers: int = None, chunksize: int = 64) -> List[Dict[str, Any]]:
+        """
+        Process a batch of items in parallel worker processes
+        
+        Items are independent, so the batch is split into chunks that are
+        mapped by a process pool. Each worker builds its own DataMapper
+        once from a copy of the keyword dictionary. Small batches and
+        single-worker runs are processed in-process to avoid pool startup cost.
+        All items of the batch share one processing timestamp.
+        
+        Args:
+            items: List of raw item metadata dictionaries
+            texts: Combined text for each item, in the same order as items
+            lda_topics_list: Optional LDA topic results for each item
+            workers: Number of worker processes (defaults to the CPU count)
+            chunksize: Number of items handed to a worker at a time
+            
+        Returns:
+            List of mapped structures in input order, as returned by process_item
+        """
+        if lda_topics_list is None:
+            lda_topics_list = [None] * len(items)
+        processed_date = datetime.now().isoformat()
+        work = [(item, text, lda_topics, processed_date)
+                for item, text, lda_topics in zip(items, texts, lda_topics_list)]
+        
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(work) <= chunksize:
+            return [self.process_item(*args) for args in work]
+        
+        return self._map_in_workers(_process_item_in_worker, work, workers, chunksize)
+    
+    def map_parallel(self, items: List[Dict[str, Any]], texts: List[str],
+                     lda_topics_list: List[List[Dict]] = None,
+                     workers: int = None, chunksize: int = 64) -> List[Dict[str, Any]]:
+        """
+        Map a batch of items to descriptive metadata in parallel worker processes
+        
+        The parallel counterpart of map_batch, using the same worker setup as
+        process_items. Small batches and single-worker runs are mapped
+        in-process with map_batch.
+        
+        Args:
+            items: List of item metadata dictionaries
+            texts: Combined text for each item, in the same order as items
+            lda_topics_list: Optional LDA topic results for each item
+            workers: Number of worker processes (defaults to the CPU count)
+            chunksize: Number of items handed to a worker at a time
+            
+        Returns:
+            List of descriptive metadata dictionaries in input order, as
+            returned by map_to_descriptive_metadata
+        """
+        if lda_topics_list is None:
+            lda_topics_list = [None] * len(items)
+        
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(items) <= chunksize:
+            return self.map_batch(items, texts, lda_topics_list)
+        
+        work = list(zip(items, texts, lda_topics_list))
+        return self._map_in_workers(_map_descriptive_in_worker, work, workers, chunksize)
+    
+    def _map_in_workers(self, function, work: List[Tuple], workers: int, chunksize: int) -> List[Any]:
+        """
+        Apply a module-level worker function to every work tuple in a process pool
+        
+        Args:
+            function: Worker function taking one work tuple
+            work: Argument tuples, one per item
+            workers: Number of worker processes
+            chunksize: Number of items handed to a worker at a time
+            
+        Returns:
+            Results in the order of work
+        """
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.keyword_dict,)) as executor:
+            return list(executor.map(function, work, chunksize=chunksize))
+
+
+# Per-process mapper used by DataMapper.process_items and map_parallel workers
+_worker_mapper = None
+
+
+def _init_worker(keyword_dict):
+    """
+    Build the DataMapper of a worker process
+    
+    Args:
+        keyword_dict: Keyword dictionary shared by all items of the batch
+    """
+    global _worker_mapper
+    _worker_mapper = DataMapper(keyword_dict)
+
+
+def _process_item_in_worker(args: Tuple[Dict[str, Any], str, List[Dict], str]) -> Dict[str, Any]:
+    """
+    Process one (item, text, lda_topics, processed_date) tuple in a worker process
+    
+    Args:
+        args: Arguments for DataMapper.process_item
+        
+    Returns:
+        Mapped structure for the item
+    """
+    return _worker_mapper.process_item(*args)
+
+
+def _map_descriptive_in_worker(args: Tuple[Dict[str, Any], str, List[Dict]]) -> Dict[str, Any]:
+    """
+    Map one (item, text, lda_topics) tuple to descriptive metadata in a worker process
+    
+    Args:
+        args: Arguments for DataMapper.map_to_descriptive_metadata
+        
+    Returns:
+        Descriptive metadata for the item
+    """
+    return _worker_mapper.map_to_descriptive_metadata(*args)
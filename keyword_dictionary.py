@@ -21,9 +21,157 @@ Date: [Current Date]
 Version: 1.0
 """
 
-from typing import Dict, List, Set
+import re
+import bisect
+import functools
+import logging
+from typing import Dict, Iterable, List, Set, Tuple
 import json
 
+try:
+    import orjson
+except ImportError:  # Optional; falls back to the standard json module
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # Optional; bulk year lookups fall back to bisect
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# First year of each dynasty range and the dynasty of each gap between starts,
+# for bisect lookups of integer years; a year where two dynasties meet (1279,
+# 1368, 1644) belongs to the earlier one
+_DYNASTY_STARTS = (618, 908, 960, 1280, 1369, 1645, 1912, 1950)
+_DYNASTY_NAMES = ('Unknown', 'Tang', 'Unknown', 'Song', 'Yuan', 'Ming', 'Qing', 'Republic', 'Modern')
+
+# Preformatted century labels by century number; only the first three centuries
+# take their own ordinal suffix, every other century ends in 'th'
+_CENTURY_LABELS = ('0th century', '1st century', '2nd century', '3rd century') + tuple(
+    f"{century}th century" for century in range(4, 26))
+
+# Museum and institution names in place fields (not production locations)
+_MUSEUM_KEYWORDS = ('museum', 'gallery', 'collection', 'hallwyl', 'herstellung', 'manufacture')
+_MUSEUM_PATTERN = re.compile('|'.join(_MUSEUM_KEYWORDS))
+
+# Category name in keyword files and get_all_keywords -> KeywordDictionary attribute
+_CATEGORY_ATTRIBUTES = {
+    'color': 'color_keywords',
+    'decoration_themes': 'decoration_themes',
+    'shape': 'shape_keywords',
+    'function': 'function_keywords',
+    'material': 'material_keywords',
+    'glaze': 'glaze_keywords',
+    'production': 'production_keywords',
+    'period': 'period_keywords'
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _dynasty_for_year(year: int) -> str:
+    """
+    Dynasty name of an integer year, memoized across all dictionaries
+    
+    Tang 618-907, Song 960-1279, Yuan 1280-1368, Ming 1369-1644,
+    Qing 1645-1911, Republic 1912-1949, Modern from 1950, else 'Unknown'
+    """
+    return _DYNASTY_NAMES[bisect.bisect_right(_DYNASTY_STARTS, year)]
+
+
+@functools.lru_cache(maxsize=4096)
+def _century_for_year(year: int) -> str:
+    """
+    Century label of a year, memoized across all dictionaries
+    """
+    return _century_label((year - 1) // 100 + 1)
+
+
+def _century_label(century: int) -> str:
+    """
+    Label of a century number, e.g. 17 -> '17th century'
+    """
+    if 0 <= century < len(_CENTURY_LABELS):
+        return _CENTURY_LABELS[century]
+    return f"{century}th century"
+
+
+def _as_tuples(mapping: Dict[str, Iterable[str]]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Copy a keyword mapping with every keyword list stored as a tuple
+    """
+    return {key: tuple(keywords) for key, keywords in mapping.items()}
+
+
+class KeywordMatcher:
+    """
+    Single-pass matcher for a set of keywords
+    
+    All keywords are compiled into one alternation regex (longest first) that
+    is tried as a lookahead at every candidate position, so a text is scanned
+    once no matter how many keywords there are. Shorter keywords that are
+    prefixes of a longer match at the same position are resolved from a table
+    built at construction time, which makes overlapping occurrences (e.g.
+    'blue' inside 'blue and white') visible just like separate searches.
+    
+    Attributes:
+        word_boundary: Whether keywords only match between word boundaries
+    """
+    
+    def __init__(self, keywords: Iterable[str], word_boundary: bool = True):
+        """
+        Compile the matcher for the given keywords
+        
+        Args:
+            keywords: Keywords to match (matched literally, case-sensitive)
+            word_boundary: Require \\b on both sides of a keyword, like
+                           re.search(r'\\b' + re.escape(keyword) + r'\\b', text)
+        """
+        self.word_boundary = word_boundary
+        self._pattern = None
+        self._prefixes = {}
+        
+        unique_keywords = sorted(set(keywords), key=lambda k: (-len(k), k))
+        if not unique_keywords:
+            return
+        
+        boundary = r'\b' if word_boundary else ''
+        alternation = '|'.join(re.escape(keyword) for keyword in unique_keywords)
+        self._pattern = re.compile(boundary + '(?=(' + alternation + ')' + boundary + ')')
+        
+        # For every keyword, the other keywords that also match wherever it matches
+        keyword_set = set(unique_keywords)
+        for keyword in unique_keywords:
+            self._prefixes[keyword] = [
+                keyword[:i] for i in range(len(keyword))
+                if keyword[:i] in keyword_set
+                and (not word_boundary or re.match(re.escape(keyword[:i]) + r'\b', keyword))
+            ]
+    
+    def find(self, text: str) -> Dict[str, None]:
+        """
+        Find every keyword occurring in the text
+        
+        Args:
+            text: Text to scan (callers pass lowercased text)
+            
+        Returns:
+            Dictionary keyed by matched keyword in order of first occurrence,
+            used as an ordered set
+        """
+        found = {}
+        if self._pattern is None:
+            return found
+        
+        for match in self._pattern.finditer(text):
+            keyword = match.group(1)
+            found[keyword] = None
+            for prefix in self._prefixes[keyword]:
+                found[prefix] = None
+        
+        return found
+
+
 class KeywordDictionary:
     """
     Keyword Dictionary Manager for cultural heritage metadata extraction
@@ -46,6 +194,14 @@ class KeywordDictionary:
         production_keywords: Production center identifications
         period_keywords: Historical period mappings
         place_normalization: Multi-language place name standardization
+        version: Incremented by rebuild_indexes whenever the keywords change,
+            so objects built from them (e.g. DataMapper's matchers) can tell
+            they are stale
+    
+    Keyword lists are stored as tuples; the mutators replace them rather than
+    changing them in place. After changing a keyword dictionary directly,
+    call rebuild_indexes so the derived indexes and caches and the version
+    follow the change.
     """
     
     def __init__(self, config_file: str = None):
@@ -56,12 +212,34 @@ class KeywordDictionary:
             config_file: Optional path to JSON file containing custom keyword mappings
         """
         self.config_file = config_file
+        self.version = 0
         self._init_keywords()
         
         # Load custom keywords from file if provided
         if config_file:
             self.load_from_file(config_file)
     
+    def __getstate__(self) -> Dict:
+        """
+        Pickle only the keyword mappings, leaving out the derived place index
+        
+        Keeps the payload sent to each worker process small; the index is
+        rebuilt from the mappings on unpickling.
+        """
+        state = self.__dict__.copy()
+        state.pop('_place_patterns', None)
+        state.pop('_exact_places', None)
+        state.pop('_normalized_places', None)
+        state.pop('_classifier', None)
+        return state
+    
+    def __setstate__(self, state: Dict):
+        """
+        Restore the keyword mappings and rebuild the derived indexes
+        """
+        self.__dict__.update(state)
+        self.rebuild_indexes()
+    
     def _init_keywords(self):
         """
         Initialize default keyword dictionaries with comprehensive terminology
@@ -288,6 +466,89 @@ class KeywordDictionary:
             # Japan variants
             'japan': ['japan', 'nippon', 'an tseapáin', '日本']
         }
+        
+        # Keyword lists never change in place, so store them compactly
+        for attribute in (*_CATEGORY_ATTRIBUTES.values(), 'place_normalization'):
+            setattr(self, attribute, _as_tuples(getattr(self, attribute)))
+        
+        self.rebuild_indexes()
+    
+    def rebuild_indexes(self):
+        """
+        Rebuild everything derived from the keywords after they change
+        
+        Recompiles the place index, resets the normalize_place cache and the
+        classify index, and increments version so objects built from the
+        keywords (e.g. DataMapper's matchers) rebuild as well. Called after
+        initialization, by every mutator and on unpickling; call it after
+        changing a keyword dictionary directly.
+        """
+        self._build_place_index()
+        
+        # Raw place values recur across items, so normalization is memoized
+        self._normalized_places = functools.lru_cache(maxsize=8192)(self._normalize_place)
+        
+        # Built on the first classify call
+        self._classifier = None
+        
+        # Tells objects built from the keywords to rebuild
+        self.version += 1
+    
+    def _build_place_index(self):
+        """
+        Compile the place name patterns and exact lookup table used by normalize_place
+        
+        Each standard place name and production place gets one alternation of
+        all its variants, kept in lookup order, so normalize_place runs one
+        regex search per place instead of one substring test per variant.
+        Place strings that are exactly a known variant are resolved ahead of
+        time. Called by rebuild_indexes.
+        """
+        self._place_patterns = []
+        
+        # Standardized place name mappings take precedence over production keywords
+        for standard_name, variants in self.place_normalization.items():
+            if variants:
+                self._place_patterns.append(
+                    (standard_name, re.compile('|'.join(re.escape(variant) for variant in variants))))
+        
+        for place_type, keywords in self.production_keywords.items():
+            if keywords:
+                self._place_patterns.append(
+                    (place_type, re.compile('|'.join(re.escape(keyword.lower()) for keyword in keywords))))
+        
+        # Normalized result of every known variant, computed by the full lookup
+        # (a variant may also contain a museum name or a higher-priority variant)
+        self._exact_places = {}
+        for variant_lists in (self.place_normalization.values(), self.production_keywords.values()):
+            for variants in variant_lists:
+                for variant in variants:
+                    variant = variant.lower()
+                    if variant in self._exact_places:
+                        continue
+                    if _MUSEUM_PATTERN.search(variant):
+                        self._exact_places[variant] = None
+                    else:
+                        standard_name = self._match_place(variant)
+                        if standard_name is not None:
+                            self._exact_places[variant] = standard_name
+    
+    def _match_place(self, place_lower: str) -> str:
+        """
+        Find the standard name of the first place pattern occurring in a lowercased place string
+        
+        Args:
+            place_lower: Lowercased, stripped place string
+            
+        Returns:
+            Standard place name, or None if no variant occurs in the string
+        """
+        # Check against standardized place name mappings, then against
+        # specific production location keywords
+        for standard_name, pattern in self._place_patterns:
+            if pattern.search(place_lower):
+                return standard_name
+        return None
     
     def normalize_place(self, place: str) -> str:
         """
@@ -311,27 +572,34 @@ class KeywordDictionary:
             >>> dict.normalize_place("Museum of Vienna")
             None  # Filtered as museum location
         """
+        return self._normalized_places(place)
+    
+    def _normalize_place(self, place: str) -> str:
+        """
+        Normalize a place name without the cache (see normalize_place)
+        
+        Args:
+            place: Raw place name string in any language
+            
+        Returns:
+            Normalized place name or None if invalid/museum location
+        """
         if not place:
             return place
             
         place_lower = place.lower().strip()
         
+        # Known variants resolve with a single lookup
+        if place_lower in self._exact_places:
+            return self._exact_places[place_lower]
+        
         # Filter out museum and institution names (not production locations)
-        museum_keywords = ['museum', 'gallery', 'collection', 'hallwyl', 'herstellung', 'manufacture']
-        if any(keyword in place_lower for keyword in museum_keywords):
+        if _MUSEUM_PATTERN.search(place_lower):
             return None
         
-        # Check against standardized place name mappings
-        for standard_name, variants in self.place_normalization.items():
-            for variant in variants:
-                if variant in place_lower:
-                    return standard_name
-        
-        # Check against specific production location keywords
-        for place_type, keywords in self.production_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in place_lower:
-                    return place_type
+        standard_name = self._match_place(place_lower)
+        if standard_name is not None:
+            return standard_name
         
         # Filter out overly long strings (likely not valid place names)
         if len(place) > 50:
@@ -339,6 +607,42 @@ class KeywordDictionary:
             
         return place
         
+    def classify(self, text: str) -> Dict[str, Set[str]]:
+        """
+        Find the keyword groups of every category that a text mentions
+        
+        The text is scanned once by a KeywordMatcher compiled from the
+        keywords of all categories (whole words, case-insensitive), and each
+        matched keyword is resolved to the groups it belongs to through an
+        inverted index, instead of testing every keyword of every group.
+        
+        Args:
+            text: Free text, e.g. an item description
+            
+        Returns:
+            Dictionary mapping category name (as in get_all_keywords) to the set
+            of matched group keys; categories without a match are left out
+            
+        Example:
+            >>> dict.classify("Kangxi vase with a dragon")
+            {'period': {'qing'}, 'shape': {'vase'}, 'decoration_themes': {'animal'}}
+        """
+        if self._classifier is None:
+            # Keyword -> every (category, group key) it belongs to
+            index = {}
+            for category, groups in self.get_all_keywords().items():
+                for key, keywords in groups.items():
+                    for keyword in keywords:
+                        index.setdefault(keyword.lower(), []).append((category, key))
+            self._classifier = (KeywordMatcher(index), index)
+        
+        matcher, index = self._classifier
+        groups = {}
+        for keyword in matcher.find(text.lower()):
+            for category, key in index[keyword]:
+                groups.setdefault(category, set()).add(key)
+        return groups
+    
     def get_dynasty_from_year(self, year: int) -> str:
         """
         Convert a year to its corresponding Chinese dynasty
@@ -355,22 +659,53 @@ class KeywordDictionary:
             >>> dict.get_dynasty_from_year(1700)
             'Qing'
         """
-        if 618 <= year <= 907:
-            return 'Tang'
-        elif 960 <= year <= 1279:
-            return 'Song'
-        elif 1279 <= year <= 1368:
-            return 'Yuan'
-        elif 1368 <= year <= 1644:
-            return 'Ming'
-        elif 1644 <= year <= 1911:
-            return 'Qing'
-        elif 1912 <= year <= 1949:
-            return 'Republic'
-        elif year >= 1950:
-            return 'Modern'
-        else:
-            return 'Unknown'
+        return _dynasty_for_year(year)
+    
+    def dynasties_for_years(self, years: Iterable[int]) -> Dict[int, str]:
+        """
+        Convert several years to their Chinese dynasties in one call
+        
+        Args:
+            years: Years as integers
+            
+        Returns:
+            Dictionary mapping each year to its dynasty name, in order of first
+            occurrence; years outside every dynasty ('Unknown') are left out
+            
+        Example:
+            >>> dict.dynasties_for_years([1500, 1700, 100])
+            {1500: 'Ming', 1700: 'Qing'}
+        """
+        dynasties = {}
+        for year in years:
+            dynasty = _dynasty_for_year(year)
+            if dynasty != 'Unknown':
+                dynasties[year] = dynasty
+        return dynasties
+    
+    def get_dynasties_from_years(self, years: Iterable[int]) -> List[str]:
+        """
+        Convert a whole column of years to dynasty names
+        
+        Vectorized with NumPy (one searchsorted over the dynasty start years)
+        when it is installed; otherwise each year is looked up like
+        get_dynasty_from_year.
+        
+        Args:
+            years: Years as integers, e.g. one per item of a catalog
+            
+        Returns:
+            Dynasty name of each year in input order, 'Unknown' outside every dynasty
+            
+        Example:
+            >>> dict.get_dynasties_from_years([1500, 1700, 100])
+            ['Ming', 'Qing', 'Unknown']
+        """
+        if np is None:
+            return [_dynasty_for_year(year) for year in years]
+        
+        indexes = np.searchsorted(_DYNASTY_STARTS, np.fromiter(years, dtype=np.int64), side='right')
+        return [_DYNASTY_NAMES[index] for index in indexes.tolist()]
     
     def get_century_from_year(self, year: int) -> str:
         """
@@ -386,38 +721,55 @@ class KeywordDictionary:
             >>> dict.get_century_from_year(1650)
             '17th century'
         """
-        century = (year - 1) // 100 + 1
+        return _century_for_year(year)
+    
+    def get_centuries_from_years(self, years: Iterable[int]) -> List[str]:
+        """
+        Convert a whole column of years to century labels
         
-        # Handle ordinal suffixes correctly
-        if century == 1:
-            return "1st century"
-        elif century == 2:
-            return "2nd century"
-        elif century == 3:
-            return "3rd century"
-        else:
-            return f"{century}th century"
+        With NumPy the century numbers are computed in one vectorized step
+        and each distinct century is labeled once; otherwise each year is
+        looked up like get_century_from_year.
+        
+        Args:
+            years: Years as integers, e.g. one per item of a catalog
+            
+        Returns:
+            Century label of each year in input order
+            
+        Example:
+            >>> dict.get_centuries_from_years([1650, 1701, 150])
+            ['17th century', '18th century', '2nd century']
+        """
+        if np is None:
+            return [_century_for_year(year) for year in years]
+        
+        centuries = (np.fromiter(years, dtype=np.int64) - 1) // 100 + 1
+        unique_centuries, inverse = np.unique(centuries, return_inverse=True)
+        labels = [_century_label(century) for century in unique_centuries.tolist()]
+        return [labels[index] for index in inverse.tolist()]
     
     def add_keyword(self, category: str, key: str, keywords: List[str]):
         """
         Add keywords to a specified category
         
         Args:
-            category: Category name (e.g., 'color', 'shape', 'material')
+            category: Category name as in get_all_keywords (e.g., 'color', 'shape', 'material')
             key: Subcategory key (e.g., 'blue and white', 'vase')
             keywords: List of new keywords to add
             
         Example:
             >>> dict.add_keyword('color', 'blue and white', ['kraak', 'transitional'])
         """
-        category_dict = getattr(self, f"{category}_keywords", None)
-        if category_dict is not None:
+        attribute = _CATEGORY_ATTRIBUTES.get(category)
+        if attribute is not None:
+            category_dict = getattr(self, attribute)
             if key in category_dict:
-                category_dict[key].extend(keywords)
                 # Remove duplicates while preserving order
-                category_dict[key] = list(set(category_dict[key]))
+                category_dict[key] = tuple(dict.fromkeys(category_dict[key] + tuple(keywords)))
             else:
-                category_dict[key] = keywords
+                category_dict[key] = tuple(keywords)
+            self.rebuild_indexes()
     
     def remove_keyword(self, category: str, key: str, keywords: List[str]):
         """
@@ -428,9 +780,12 @@ class KeywordDictionary:
             key: Subcategory key
             keywords: List of keywords to remove
         """
-        category_dict = getattr(self, f"{category}_keywords", None)
+        attribute = _CATEGORY_ATTRIBUTES.get(category)
+        category_dict = getattr(self, attribute) if attribute is not None else None
         if category_dict is not None and key in category_dict:
-            category_dict[key] = [k for k in category_dict[key] if k not in keywords]
+            removed = set(keywords)
+            category_dict[key] = tuple(k for k in category_dict[key] if k not in removed)
+            self.rebuild_indexes()
     
     def update_category(self, category: str, new_dict: Dict[str, List[str]]):
         """
@@ -440,36 +795,35 @@ class KeywordDictionary:
             category: Category name to update
             new_dict: New dictionary of keyword mappings
         """
-        if hasattr(self, f"{category}_keywords"):
-            setattr(self, f"{category}_keywords", new_dict)
+        attribute = _CATEGORY_ATTRIBUTES.get(category)
+        if attribute is not None:
+            setattr(self, attribute, _as_tuples(new_dict))
+            self.rebuild_indexes()
     
-    def get_all_keywords(self) -> Dict[str, Dict[str, List[str]]]:
+    def get_all_keywords(self) -> Dict[str, Dict[str, Tuple[str, ...]]]:
         """
         Get all keyword dictionaries as a single structure
         
         Returns:
             Dictionary containing all keyword categories and their mappings
         """
-        return {
-            'color': self.color_keywords,
-            'decoration_themes': self.decoration_themes,
-            'shape': self.shape_keywords,
-            'function': self.function_keywords,
-            'material': self.material_keywords,
-            'glaze': self.glaze_keywords,
-            'production': self.production_keywords,
-            'period': self.period_keywords
-        }
+        return {category: getattr(self, attribute) for category, attribute in _CATEGORY_ATTRIBUTES.items()}
     
     def save_to_file(self, filename: str):
         """
         Save keyword dictionaries to JSON file
         
+        Uses orjson when it is installed, otherwise the standard json module.
+        
         Args:
             filename: Path to output JSON file
         """
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.get_all_keywords(), f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(self.get_all_keywords(), option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(self.get_all_keywords(), f, ensure_ascii=False, indent=2)
     
     def load_from_file(self, filename: str):
         """
@@ -484,19 +838,21 @@ class KeywordDictionary:
             of keyword mappings.
         """
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(filename, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(filename, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
                 
-            # Load each category from the JSON data
-            self.color_keywords = data.get('color', {})
-            self.decoration_themes = data.get('decoration_themes', {})
-            self.shape_keywords = data.get('shape', {})
-            self.function_keywords = data.get('function', {})
-            self.material_keywords = data.get('material', {})
-            self.glaze_keywords = data.get('glaze', {})
-            self.production_keywords = data.get('production', {})
-            self.period_keywords = data.get('period', {})
-            
-            print(f"✅ Successfully loaded keyword dictionary from {filename}")
+            # Convert every category before assigning any, so a malformed file
+            # leaves the current keywords untouched
+            categories = {attribute: _as_tuples(data.get(category, {}))
+                          for category, attribute in _CATEGORY_ATTRIBUTES.items()}
+            for attribute, category_dict in categories.items():
+                setattr(self, attribute, category_dict)
+            self.rebuild_indexes()
+            
+            logger.debug("Loaded keyword dictionary from %s", filename)
         except Exception as e:
-            print(f"❌ Failed to load keyword dictionary: {e}")
+            logger.error("Failed to load keyword dictionary from %s: %s", filename, e)
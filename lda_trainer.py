@@ -3,9 +3,33 @@
 
 import numpy as np
 from typing import List, Dict, Tuple, Optional
-from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
 from sklearn.decomposition import LatentDirichletAllocation
 from collections import Counter
+from itertools import combinations, islice
+
+
+def _top_indices(weights, n: int):
+    """
+    Indices of the n largest weights, largest first
+    
+    Partitions out the top n in linear time and sorts only those, instead of
+    sorting the whole vector like weights.argsort()[-n:][::-1] (equal weights
+    may come out in a different order).
+    
+    Args:
+        weights: 1-D array of weights (e.g. one topic's word weights)
+        n: Number of indices to return
+        
+    Returns:
+        Array of indices sorted by descending weight
+    """
+    if not 0 < n < len(weights):
+        return weights.argsort()[-n:][::-1]
+    
+    top = np.argpartition(weights, -n)[-n:]
+    return top[weights[top].argsort()][::-1]
+
 
 class LDATrainer:
     """
@@ -16,6 +40,23 @@ class LDATrainer:
     and keywords from documents.
     """
     
+    # LDA settings shared by the topic count search and the final model
+    _LDA_PARAMS = {
+        'random_state': 42,  # Ensure reproducibility
+        'learning_method': 'batch',  # Use batch learning for better accuracy
+        'doc_topic_prior': 0.05,  # Alpha - controls document-topic sparsity
+        'topic_word_prior': 0.001,  # Beta - controls topic-word sparsity
+        'n_jobs': 1  # Single process; BLAS threads already use the cores, and a
+                     # joblib pool per fit/transform call costs more than it saves
+    }
+    
+    # Iterations per candidate model in find_optimal_topics; candidates are only
+    # compared with each other, and train_lda refits the chosen count with 200
+    _SEARCH_MAX_ITER = 30
+    
+    # Top words per topic kept in the table built after training
+    _TOP_WORDS_CACHED = 50
+    
     def __init__(self, n_topics: Optional[int] = None):
         """
         Initialize the LDA Trainer
@@ -26,13 +67,15 @@ class LDATrainer:
         self.n_topics = n_topics
         self.lda_model = None
         self.vectorizer = None
-        self.tfidf_vectorizer = None
+        self.tfidf_transformer = None
+        self._reset_topic_top_words()
         self.optimal_topics = None
         self.topic_labels = {}
     
     def find_optimal_topics(self, texts: List[str], 
                         min_topics: int = 5, 
-                        max_topics: int = 20) -> int:
+                        max_topics: int = 20,
+                        doc_term_matrix=None) -> int:
         """
         Find optimal number of topics using perplexity and coherence scores
         
@@ -40,6 +83,8 @@ class LDATrainer:
             texts: List of document texts
             min_topics: Minimum number of topics to evaluate
             max_topics: Maximum number of topics to evaluate
+            doc_term_matrix: Optional document-term matrix of texts that is already
+                             vectorized (as in train_lda); built here if None
             
         Returns:
             Optimal number of topics based on elbow method
@@ -52,15 +97,16 @@ class LDATrainer:
             return 10
         
         # Create bag-of-words model for topic evaluation
-        temp_vectorizer = CountVectorizer(
-            max_df=0.7,  # Ignore terms that appear in more than 70% of documents
-            min_df=5,    # Ignore terms that appear in less than 5 documents
-            max_features=500,  # Limit vocabulary size
-            ngram_range=(1, 2),  # Use both unigrams and bigrams
-            token_pattern=r'\b[a-zA-Z]{3,}\b'  # Words with at least 3 letters
-        )
-        
-        doc_term_matrix = temp_vectorizer.fit_transform(texts)
+        if doc_term_matrix is None:
+            temp_vectorizer = CountVectorizer(
+                max_df=0.7,  # Ignore terms that appear in more than 70% of documents
+                min_df=5,    # Ignore terms that appear in less than 5 documents
+                max_features=500,  # Limit vocabulary size
+                ngram_range=(1, 2),  # Use both unigrams and bigrams
+                token_pattern=r'\b[a-zA-Z]{3,}\b'  # Words with at least 3 letters
+            )
+            
+            doc_term_matrix = temp_vectorizer.fit_transform(texts)
         
         # Calculate perplexity and coherence for different topic counts
         perplexities = []
@@ -73,12 +119,8 @@ class LDATrainer:
             # Train LDA model with current topic count
             lda = LatentDirichletAllocation(
                 n_components=n_topic,
-                random_state=42,  # For reproducibility
-                max_iter=100,
-                learning_method='batch',
-                doc_topic_prior=0.05,  # Alpha parameter - document-topic density
-                topic_word_prior=0.001,  # Beta parameter - topic-word density
-                n_jobs=-1  # Use all available CPU cores
+                max_iter=self._SEARCH_MAX_ITER,
+                **self._LDA_PARAMS
             )
             
             lda.fit(doc_term_matrix)
@@ -88,7 +130,7 @@ class LDATrainer:
             perplexities.append(perplexity)
             
             # Calculate topic coherence (higher is better)
-            coherence = self._calculate_topic_coherence(lda, temp_vectorizer, texts)
+            coherence = self._calculate_topic_coherence(lda, doc_term_matrix)
             coherences.append(coherence)
             
             print(f" - Perplexity: {perplexity:.2f}, Coherence: {coherence:.3f}")
@@ -100,39 +142,45 @@ class LDATrainer:
         
         return optimal_topics
     
-    def _calculate_topic_coherence(self, lda_model, vectorizer, texts: List[str]) -> float:
+    def _calculate_topic_coherence(self, lda_model, doc_term_matrix) -> float:
         """
         Calculate topic coherence score
         
         Topic coherence measures how semantically similar the top words
         in a topic are to each other. Higher coherence indicates better topics.
+        Document and co-occurrence counts come from the document-term matrix,
+        so a word counts as present in a document when it is one of its
+        tokens (not merely a substring of the text), and all counts are
+        computed in one sparse product.
         
         Args:
             lda_model: Trained LDA model
-            vectorizer: Fitted CountVectorizer
-            texts: Original text documents
+            doc_term_matrix: Document-term count matrix the model was trained on
             
         Returns:
             Average coherence score across all topics
         """
-        feature_names = vectorizer.get_feature_names_out()
+        # Get top 10 words with highest probability in each topic
+        topic_top_words = [_top_indices(lda_model.components_[topic_idx], 10)
+                           for topic_idx in range(lda_model.n_components)]
+        
+        # Document frequencies and pairwise co-occurrence counts of all top words
+        top_vocabulary = np.unique(np.concatenate(topic_top_words))
+        column_of = {word: column for column, word in enumerate(top_vocabulary.tolist())}
+        occurrences = (doc_term_matrix[:, top_vocabulary] > 0).astype(np.int32)
+        doc_counts = np.asarray(occurrences.sum(axis=0)).ravel()
+        co_counts = (occurrences.T @ occurrences).toarray()
+        
         coherence_scores = []
         
-        for topic_idx in range(lda_model.n_components):
-            # Get top 10 words with highest probability in this topic
-            top_word_indices = lda_model.components_[topic_idx].argsort()[-10:][::-1]
-            top_words = [feature_names[i] for i in top_word_indices]
-            
-            # Calculate co-occurrence for word pairs
-            word_pairs = [(top_words[i], top_words[j]) 
-                         for i in range(len(top_words)) 
-                         for j in range(i+1, len(top_words))]
+        for top_word_indices in topic_top_words:
+            top_columns = [column_of[i] for i in top_word_indices.tolist()]
             
             # Calculate PMI (Pointwise Mutual Information) based coherence
             pair_scores = []
-            for w1, w2 in word_pairs[:10]:  # Use top 10 pairs
-                co_occur = sum(1 for text in texts if w1 in text and w2 in text)
-                occur_w1 = sum(1 for text in texts if w1 in text)
+            for w1, w2 in islice(combinations(top_columns, 2), 10):  # Use top 10 pairs
+                co_occur = co_counts[w1, w2]
+                occur_w1 = doc_counts[w1]
                 
                 if occur_w1 > 0:
                     score = co_occur / occur_w1
@@ -189,12 +237,6 @@ class LDATrainer:
         
         print(f"📊 Number of training documents: {len(texts)}")
         
-        # Determine number of topics
-        if use_optimal_topics and self.n_topics is None:
-            self.n_topics = self.find_optimal_topics(texts, min_topics=8, max_topics=20)
-        elif self.n_topics is None:
-            self.n_topics = 15  # Default fallback
-        
         # Create Bag-of-Words model
         self.vectorizer = CountVectorizer(
             max_df=0.7,  # Remove words appearing in >70% of docs (too common)
@@ -204,15 +246,6 @@ class LDATrainer:
             token_pattern=r'\b[a-zA-Z]{3,}\b'  # Only words with 3+ letters
         )
         
-        # Create TF-IDF model for keyword extraction
-        self.tfidf_vectorizer = TfidfVectorizer(
-            max_df=0.7,
-            min_df=5,
-            max_features=500,
-            ngram_range=(1, 2),
-            token_pattern=r'\b[a-zA-Z]{3,}\b'
-        )
-        
         try:
             # Fit vectorizer and transform documents to term-document matrix
             doc_term_matrix = self.vectorizer.fit_transform(texts)
@@ -221,22 +254,28 @@ class LDATrainer:
             vocab_size = len(self.vectorizer.get_feature_names_out())
             print(f"📖 Vocabulary size: {vocab_size}")
             
-            # Fit TF-IDF model
-            self.tfidf_vectorizer.fit_transform(texts)
+            # Fit TF-IDF weighting for keyword extraction on the same counts,
+            # so the corpus is tokenized only once
+            self.tfidf_transformer = TfidfTransformer().fit(doc_term_matrix)
+            
+            # Determine number of topics, reusing the document-term matrix
+            if use_optimal_topics and self.n_topics is None:
+                self.n_topics = self.find_optimal_topics(texts, min_topics=8, max_topics=20,
+                                                         doc_term_matrix=doc_term_matrix)
+            elif self.n_topics is None:
+                self.n_topics = 15  # Default fallback
             
             # Train LDA model
             self.lda_model = LatentDirichletAllocation(
                 n_components=self.n_topics,
-                random_state=42,  # Ensure reproducibility
                 max_iter=200,  # Maximum iterations for convergence
-                learning_method='batch',  # Use batch learning for better accuracy
+                evaluate_every=5,  # Stop early once perplexity has converged
                 learning_offset=10.0,  # Learning rate offset
-                doc_topic_prior=0.05,  # Alpha - controls document-topic sparsity
-                topic_word_prior=0.001,  # Beta - controls topic-word sparsity
-                n_jobs=-1  # Utilize all CPU cores
+                **self._LDA_PARAMS
             )
             
             self.lda_model.fit(doc_term_matrix)
+            self._build_topic_top_words()
             
             print("✅ LDA model training completed")
             
@@ -250,6 +289,32 @@ class LDATrainer:
         except Exception as e:
             print(f"❌ LDA training failed: {e}")
             self.lda_model = None
+            self._reset_topic_top_words()
+    
+    def _reset_topic_top_words(self):
+        """Drop the top-word table of a previously trained model"""
+        self._topic_top_indices = None
+        self._topic_top_weights = None
+        self._feature_names = None
+    
+    def _build_topic_top_words(self):
+        """
+        Precompute each topic's top words, sorted by descending weight
+        
+        get_topic_words then serves requests for up to _TOP_WORDS_CACHED words
+        by slicing this table instead of ranking the whole vocabulary per call.
+        """
+        components = self.lda_model.components_
+        n_top = min(self._TOP_WORDS_CACHED, components.shape[1])
+        
+        # Partition out each topic's top words, then sort only those
+        top = np.argpartition(-components, n_top - 1, axis=1)[:, :n_top]
+        top_weights = np.take_along_axis(components, top, axis=1)
+        order = np.argsort(-top_weights, axis=1, kind='stable')
+        
+        self._topic_top_indices = np.take_along_axis(top, order, axis=1)
+        self._topic_top_weights = np.take_along_axis(top_weights, order, axis=1)
+        self._feature_names = self.vectorizer.get_feature_names_out()
     
     def get_document_topics(self, text: str) -> List[Dict]:
         """
@@ -262,34 +327,64 @@ class LDATrainer:
             List of dictionaries containing topic_id and probability,
             sorted by probability in descending order
         """
-        if not self.lda_model or not self.vectorizer:
-            return []
+        return self.get_document_topics_batch([text])[0]
+    
+    def get_document_topics_batch(self, texts: List[str]) -> List[List[Dict]]:
+        """
+        Get topic distributions for many documents at once
         
-        try:
-            # Transform document to vector representation
-            doc_vector = self.vectorizer.transform([text])
+        All documents are vectorized and transformed in one call each, instead
+        of paying the per-call overhead of get_document_topics per document.
+        If the batch fails, the documents are retried one at a time, so only
+        the documents that fail on their own get no topics.
+        
+        Args:
+            texts: Document texts to analyze
             
-            # Check if document contains known vocabulary
-            if doc_vector.nnz > 0:  # nnz = number of non-zero elements
-                # Get topic distribution for this document
-                topic_dist = self.lda_model.transform(doc_vector)[0]
-                
-                topics = []
-                for idx, prob in enumerate(topic_dist):
-                    if prob > 0.15:  # Threshold for significant topics
-                        topics.append({
-                            'topic_id': idx,
-                            'probability': float(prob)
-                        })
-                
-                # Sort by probability and return top 3 topics
-                topics.sort(key=lambda x: x['probability'], reverse=True)
-                return topics[:3]
-                
-        except:
-            pass
+        Returns:
+            For each text, in order, the list get_document_topics returns for it
+        """
+        if not texts or not self.lda_model or not self.vectorizer:
+            return [[] for _ in texts]
         
-        return []
+        try:
+            return self._document_topics(texts)
+        except (AttributeError, TypeError, ValueError):
+            # Malformed documents (e.g. non-string values) fail the whole batch
+            results = []
+            for text in texts:
+                try:
+                    results.append(self._document_topics([text])[0])
+                except (AttributeError, TypeError, ValueError):
+                    results.append([])
+            return results
+    
+    def _document_topics(self, texts: List[str]) -> List[List[Dict]]:
+        """
+        Topics of each document, letting vectorizer and model errors propagate
+        """
+        results = [[] for _ in texts]
+        
+        # Transform documents to vector representation
+        doc_vectors = self.vectorizer.transform(texts)
+        
+        # Only documents containing known vocabulary get topics
+        known_rows = np.flatnonzero(doc_vectors.getnnz(axis=1))
+        if len(known_rows) == 0:
+            return results
+        
+        # Get topic distributions for these documents
+        topic_dists = self.lda_model.transform(doc_vectors[known_rows])
+        
+        for row, topic_dist in zip(known_rows.tolist(), topic_dists):
+            # Top 3 topics by probability above the significance threshold
+            top_topics = np.argsort(-topic_dist, kind='stable')[:3]
+            results[row] = [
+                {'topic_id': int(idx), 'probability': float(topic_dist[idx])}
+                for idx in top_topics if topic_dist[idx] > 0.15
+            ]
+        
+        return results
     
     def get_topic_words(self, topic_id: int, n_words: int = 10) -> List[Tuple[str, float]]:
         """
@@ -305,6 +400,12 @@ class LDATrainer:
         if not self.lda_model or not self.vectorizer:
             return []
         
+        # Serve from the top-word table built at training time
+        if self._topic_top_indices is not None and 0 < n_words <= self._topic_top_indices.shape[1]:
+            top_indices = self._topic_top_indices[topic_id, :n_words]
+            top_weights = self._topic_top_weights[topic_id, :n_words]
+            return list(zip(self._feature_names[top_indices], top_weights))
+        
         # Get vocabulary
         feature_names = self.vectorizer.get_feature_names_out()
         
@@ -312,7 +413,7 @@ class LDATrainer:
         topic = self.lda_model.components_[topic_id]
         
         # Get indices of top words
-        top_indices = topic.argsort()[-n_words:][::-1]
+        top_indices = _top_indices(topic, n_words)
         
         # Create list of (word, weight) pairs
         words_weights = []
@@ -335,19 +436,20 @@ class LDATrainer:
         Returns:
             List of (keyword, tfidf_score) tuples sorted by score
         """
-        if not texts or not self.tfidf_vectorizer:
+        if not texts or not self.tfidf_transformer or not self.vectorizer:
             return []
         
         try:
             # Transform texts to TF-IDF matrix
-            tfidf_matrix = self.tfidf_vectorizer.transform(texts)
-            feature_names = self.tfidf_vectorizer.get_feature_names_out()
+            tfidf_matrix = self.tfidf_transformer.transform(self.vectorizer.transform(texts))
+            feature_names = self.vectorizer.get_feature_names_out()
             
             # Calculate average TF-IDF score across all documents
-            avg_tfidf = np.mean(tfidf_matrix.toarray(), axis=0)
+            # (directly on the sparse matrix, without densifying it)
+            avg_tfidf = np.asarray(tfidf_matrix.mean(axis=0)).ravel()
             
             # Get indices of top_n keywords
-            top_indices = avg_tfidf.argsort()[-top_n:][::-1]
+            top_indices = _top_indices(avg_tfidf, top_n)
             
             # Create list of (keyword, score) pairs
             keywords = [(feature_names[i], avg_tfidf[i]) for i in top_indices]
@@ -10,6 +10,7 @@ import warnings
 warnings.filterwarnings('ignore', category=UserWarning, module='joblib')
 
 import json
+from datetime import datetime
 from typing import Dict, Any
 from text_preprocessing import TextPreprocessor
 from lda_trainer import LDATrainer
@@ -71,6 +72,7 @@ class PorcelainProcessor:
         print("\n🔍 Preparing text data...")
         all_texts = []  # Store all raw texts
         processed_texts = []  # Store preprocessed texts for LDA
+        item_processed_texts = []  # Preprocessed text of every item, empty or not
         
         for item in data:
             # Extract raw text from item
@@ -79,6 +81,7 @@ class PorcelainProcessor:
             
             # Preprocess text (tokenization, cleaning, etc.)
             processed_text = self.preprocessor.preprocess_text(raw_text)
+            item_processed_texts.append(processed_text)
             if processed_text:
                 processed_texts.append(processed_text)
         
@@ -93,6 +96,19 @@ class PorcelainProcessor:
         processed_data = []
         stats = self._init_stats()
         
+        # All items of one run share the same processing timestamp
+        processed_date = datetime.now().isoformat()
+        
+        # Extract LDA topics for all items in one batch if model is trained
+        item_lda_topics = [None] * len(data)
+        if self.lda_trainer.lda_model:
+            topic_rows = [i for i, text in enumerate(item_processed_texts) if text]
+            batch_topics = self.lda_trainer.get_document_topics_batch(
+                [item_processed_texts[i] for i in topic_rows]
+            )
+            for i, topics in zip(topic_rows, batch_topics):
+                item_lda_topics[i] = topics
+        
         print("\n🔄 Starting data mapping...")
         for i, item in enumerate(data):
             # Progress indicator for large datasets
@@ -101,15 +117,10 @@ class PorcelainProcessor:
             
             # Get text for current item
             raw_text = all_texts[i]
-            processed_text = self.preprocessor.preprocess_text(raw_text)
-            
-            # Extract LDA topics if model is trained
-            lda_topics = None
-            if self.lda_trainer.lda_model and processed_text:
-                lda_topics = self.lda_trainer.get_document_topics(processed_text)
+            lda_topics = item_lda_topics[i]
             
             # Map item to structured format
-            result = self.mapper.process_item(item, raw_text, lda_topics)
+            result = self.mapper.process_item(item, raw_text, lda_topics, processed_date)
             
             # Update statistics based on processing results
             if 'error' not in result.get('ProcessingMetadata', {}):